@@ -1,42 +1,370 @@
 import sys
 import json
 import os
-import hashlib # For password hashing
+import hashlib # For legacy SHA-256 password hashes
+import hmac # For constant-time hash comparison
 from datetime import datetime, timedelta
 import threading
+import concurrent.futures
+import bisect
+from operator import attrgetter
+from functools import lru_cache
+import time
+import logging
 import speech_recognition as sr
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QTextEdit, QPushButton, QListWidget,
-    QListWidgetItem, QLabel, QDateTimeEdit, QMessageBox,
+    QLineEdit, QTextEdit, QPushButton, QListView,
+    QLabel, QDateTimeEdit, QMessageBox,
     QStackedWidget, QComboBox, QFrame, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QDateTime, QTimer, QSize, pyqtSignal
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import (
+    Qt, QDateTime, QTimer, QSize, pyqtSignal, pyqtSlot, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex
+)
+from PyQt5.QtGui import QIcon, QColor
 
 # Imports for email notification (standard Python libraries)
 import smtplib
 import ssl
 from email.mime.text import MIMEText
 
-# Imports for SMS notification (Twilio)
-# Make sure to install: pip install twilio
-try:
-    from twilio.rest import Client
-    TWILIO_AVAILABLE = True
-except ImportError:
-    TWILIO_AVAILABLE = False
-    print("Twilio library not found. SMS notifications will not be available. Please install it using 'pip install twilio'.")
+logger = logging.getLogger(__name__)
 
-# Imports for Native Desktop Notifications (Plyer)
-# Make sure to install: pip install plyer
+# Faster JSON (de)serialization via orjson, falling back to the standard library.
+# Both variants work on bytes and write compact JSON; decode errors are json.JSONDecodeError in either case.
+# Make sure to install: pip install orjson
 try:
-    from plyer import notification
-    PLYER_AVAILABLE = True
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
 except ImportError:
-    PLYER_AVAILABLE = False
-    print("Plyer library not found. Native desktop notifications will not be available. Please install it using 'pip install plyer'.")
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# Imports for password hashing (Argon2id)
+# Make sure to install: pip install argon2-cffi
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+
+# SMS notifications (Twilio) and native desktop notifications (Plyer) are optional
+# and imported on first use by MainTaskManagerUI, so they don't slow down startup.
+# Make sure to install: pip install twilio plyer
+
+# Shared Argon2id hasher used for all stored passwords.
+_ph = PasswordHasher(memory_cost=65536, time_cost=3, parallelism=2)
+# Verified against for unknown usernames so they cost as much as a wrong password.
+# Precomputed to keep hashing out of startup; must use the same parameters as _ph.
+_DUMMY_HASH = "$argon2id$v=19$m=65536,t=3,p=2$24R78wHMZj4lo+ZL+C2hCg$HMbMcbrVMGyPbxd4975/1QymNSvZr2F7w2AM/uSA43s"
+
+# --- Application Stylesheet ---
+# Applied once to the QApplication so Qt parses it a single time and every window
+# (and message box) shares it. Per-page differences use the pages' objectName selectors.
+APP_QSS = """
+    QWidget {
+        background-color: #2b2b2b;
+        color: #e0e0e0;
+        font-family: "Segoe UI", "Helvetica Neue", Arial, sans-serif;
+        font-size: 14px;
+    }
+
+    /* Container Frames */
+    QFrame#inputContainer, QFrame#listContainer {
+        background-color: #3c3c3c;
+        border-radius: 10px;
+        padding: 10px;
+    }
+
+    QFrame#detailsPanel {
+        background-color: #4a4a4a;
+        border-radius: 8px;
+        border: 1px solid #555555;
+    }
+
+    /* Labels */
+    QLabel {
+        color: #f0f0f0;
+        font-weight: 500;
+    }
+    QLabel#h1 {
+        font-size: 20px;
+        font-weight: bold;
+        color: #6a9de3;
+        margin-bottom: 5px;
+    }
+    QLabel#detail {
+        font-size: 13px;
+        color: #d0d0d0;
+    }
+    QLabel#placeholder {
+        color: #999999;
+        font-style: italic;
+        font-size: 16px;
+    }
+
+
+    /* LineEdits (Task Name, Next Step) */
+    QLineEdit, QTextEdit {
+        background-color: #4a4a4a;
+        border: 1px solid #5c5c5c;
+        border-radius: 5px;
+        padding: 8px;
+        color: #e0e0e0;
+        selection-background-color: #6a9de3;
+    }
+    QLineEdit:focus, QTextEdit:focus {
+        border: 1px solid #6a9de3;
+        background-color: #404040;
+    }
+
+    /* QTextEdit */
+    QTextEdit {
+        min-height: 80px;
+    }
+
+    /* QDateTimeEdit */
+    QDateTimeEdit {
+        background-color: #4a4a4a;
+        border: 1px solid #5c5c5c;
+        border-radius: 5px;
+        padding: 8px;
+        color: #e0e0e0;
+        selection-background-color: #6a9de3;
+    }
+    QDateTimeEdit::drop-down {
+        border: 0px;
+        subcontrol-origin: padding;
+        subcontrol-position: center right;
+        width: 20px;
+    }
+    QDateTimeEdit::down-arrow {
+        width: 0px;
+        height: 0px;
+    }
+
+    /* QComboBox (Priority) */
+    QComboBox {
+        background-color: #4a4a4a;
+        border: 1px solid #5c5c5c;
+        border-radius: 5px;
+        padding: 8px;
+        color: #e0e0e0;
+        selection-background-color: #6a9de3;
+    }
+    QComboBox::drop-down {
+        border: 0px;
+        subcontrol-origin: padding;
+        subcontrol-position: center right;
+        width: 20px;
+    }
+    QComboBox::down-arrow {
+        width: 0px;
+        height: 0px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #4a4a4a;
+        border: 1px solid #6a9de3;
+        selection-background-color: #6a9de3;
+        color: #e0e0e0;
+    }
+
+
+    /* Buttons */
+    QPushButton {
+        background-color: #5c5c5c;
+        border: none;
+        border-radius: 7px;
+        padding: 10px 15px;
+        color: #ffffff;
+        font-weight: bold;
+    }
+
+    QPushButton:hover {
+        background-color: #6a6a6a;
+    }
+
+    QPushButton:pressed {
+        background-color: #4a4a4a;
+    }
+
+    QPushButton:disabled {
+        background-color: #3a3a3a;
+        color: #888888;
+    }
+
+    /* Specific button styles */
+    QPushButton#primaryButton {
+        background-color: #6a9de3;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #7ab0ff;
+    }
+    QPushButton#primaryButton:pressed {
+        background-color: #5d8edb;
+    }
+
+    QPushButton#secondaryButton {
+        background-color: #e39d6a;
+    }
+    QPushButton#secondaryButton:hover {
+        background-color: #ffb07a;
+    }
+    QPushButton#secondaryButton:pressed {
+        background-color: #db8e5d;
+    }
+
+    QPushButton#tertiaryButton {
+        background-color: #7a6ae3;
+    }
+    QPushButton#tertiaryButton:hover {
+        background-color: #8f7aff;
+    }
+    QPushButton#tertiaryButton:pressed {
+        background-color: #6e5edb;
+    }
+
+    QPushButton#actionButton {
+        background-color: #555555;
+    }
+    QPushButton#actionButton:hover {
+        background-color: #666666;
+    }
+    QPushButton#actionButton:pressed {
+        background-color: #444444;
+    }
+
+    /* Voice Button */
+    QPushButton#voiceButton {
+        background-color: #6a9de3;
+        border: none;
+        border-radius: 8px;
+        padding: 8px;
+        min-width: 36px;
+        min-height: 36px;
+    }
+    QPushButton#voiceButton:hover {
+        background-color: #7ab0ff;
+    }
+    QPushButton#voiceButton:pressed {
+        background-color: #5d8edb;
+    }
+    QPushButton#voiceButton:disabled {
+        background-color: #555555;
+    }
+
+
+    /* QListView (Task List) */
+    QListView {
+        background-color: #4a4a4a;
+        border: 1px solid #5c5c5c;
+        border-radius: 8px;
+        padding: 5px;
+        outline: 0;
+    }
+
+    QListView::item {
+        padding: 8px 10px;
+        margin-bottom: 3px;
+        border-radius: 5px;
+        color: #e0e0e0;
+        background-color: #555555;
+    }
+
+    QListView::item:selected {
+        background-color: #6a9de3;
+        color: #ffffff;
+        border: 1px solid #6a9de3;
+    }
+
+    QListView::item:hover:!selected {
+        background-color: #606060;
+    }
+
+    /* Style for completed tasks in the list */
+    QListView::item[completed="true"] {
+        color: #aaaaaa;
+        background-color: #444444;
+        text-decoration: line-through;
+    }
+
+    /* Login / Sign Up pages */
+    QFrame#loginFrame, QFrame#signupFrame {
+        background-color: #3c3c3c;
+        border-radius: 15px;
+        padding: 20px;
+    }
+    QFrame#loginFrame {
+        min-width: 300px;
+    }
+    QFrame#signupFrame {
+        min-width: 350px;
+    }
+    QLabel#loginTitle, QLabel#signupTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #6a9de3;
+        margin-bottom: 20px;
+    }
+    QLabel#signupTitle {
+        color: #e39d6a; /* Orange highlight for signup */
+    }
+    QLabel#loginPrompt {
+        font-size: 13px;
+        font-weight: normal;
+        color: #bbbbbb;
+    }
+    QFrame#loginFrame QLineEdit, QFrame#signupFrame QLineEdit {
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QFrame#loginFrame QLineEdit:focus, QFrame#signupFrame QLineEdit:focus {
+        border: 1px solid #6a9de3;
+        background-color: #404040;
+    }
+    QFrame#loginFrame QPushButton#primaryButton, QFrame#signupFrame QPushButton#primaryButton {
+        border-radius: 8px;
+        padding: 12px 20px;
+    }
+    QPushButton#tertiaryButtonSmall {
+        background-color: transparent;
+        border: none;
+        color: #7a6ae3;
+        font-weight: bold;
+        padding: 5px;
+    }
+    QPushButton#tertiaryButtonSmall:hover, QPushButton#tertiaryButtonSmall:pressed {
+        background-color: transparent;
+        color: #8f7aff;
+        text-decoration: underline;
+    }
+
+    /* Message boxes */
+    QMessageBox {
+        background-color: #3c3c3c;
+        color: #e0e0e0;
+    }
+    QMessageBox QLabel {
+        color: #e0e0e0;
+    }
+    QMessageBox QPushButton {
+        background-color: #6a9de3;
+        border: none;
+        border-radius: 5px;
+        padding: 7px 15px;
+        color: #ffffff;
+        font-weight: bold;
+    }
+    QMessageBox QPushButton:hover {
+        background-color: #7ab0ff;
+    }
+    QMessageBox QPushButton:pressed {
+        background-color: #5d8edb;
+    }
+"""
+
 
 # --- Voice Recognition Thread ---
 class VoiceRecognitionThread(QWidget):
@@ -67,96 +395,317 @@ class VoiceRecognitionThread(QWidget):
         finally:
             self.is_listening = False
 
+# --- Background Notification Worker ---
+class NotificationWorker(QRunnable):
+    """
+    Runs a blocking notification call (email, SMS, desktop) on a QThreadPool
+    thread so network latency never stalls the Qt event loop.
+    """
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        try:
+            self.fn(*self.args)
+        except Exception as e:
+            logger.error("Notification worker failed: %s", e)
+
 # --- Task Data Model ---
+_PRIORITY_ORDER = {"High": 0, "Medium": 1, "Low": 2}
+DUE_DATE_FORMAT = "%Y-%m-%d %H:%M" # Display format; matches the "yyyy-MM-dd HH:mm" of the date picker
+
+def parse_due_date(text):
+    """Converts a "yyyy-MM-dd HH:mm" string to a Unix timestamp, or None if it can't be parsed."""
+    try:
+        return int(datetime.strptime(text, DUE_DATE_FORMAT).timestamp())
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=1024)
+def format_due_date(timestamp):
+    """Formats a Unix timestamp for display. Memoized: list rebuilds and reminders re-format the same few values."""
+    return datetime.fromtimestamp(timestamp).strftime(DUE_DATE_FORMAT)
+
+# Persisted Task attributes, in the order they are written to the tasks file.
+_TASK_FIELDS = ("name", "due_date", "description", "next_step", "priority", "completed", "reminded")
+
 class Task:
     """
     Represents a single task with its properties.
     Includes attributes for name, due date, description, next step, priority,
     completion status, and a 'reminded' flag to prevent multiple time-based reminders.
+    Uses __slots__ to keep per-task memory small; (de)serialization goes through _TASK_FIELDS.
     """
+    __slots__ = _TASK_FIELDS
+
     def __init__(self, name, due_date, description="", next_step="", priority="Medium", completed=False, reminded=False):
         self.name = name
-        self.due_date = due_date  # Stored as a string (e.g., "yyyy-MM-dd HH:mm")
+        # Unix timestamp in seconds (None if unknown). Older task files stored a "yyyy-MM-dd HH:mm"
+        # string, which is converted once here; it is only formatted again for display.
+        self.due_date = parse_due_date(due_date) if isinstance(due_date, str) else due_date
         self.description = description
         self.next_step = next_step
         self.priority = priority # "High", "Medium", "Low"
         self.completed = completed
         self.reminded = reminded # True if a time-based reminder has been sent for this task
 
-    def to_dict(self):
+    def due_date_text(self):
+        """Returns the due date formatted for display, e.g. "2024-05-01 14:30"."""
+        if self.due_date is None:
+            return "N/A"
+        return format_due_date(self.due_date)
+
+    def copy(self):
+        """Returns an independent snapshot of this task, e.g. for use on a worker thread."""
+        return Task(**{field: getattr(self, field) for field in _TASK_FIELDS})
+
+    def is_due(self, now_ts, window=0):
         """
-        Converts the task object to a dictionary for JSON serialization.
+        True if this task still needs its reminder at now_ts (Unix seconds), i.e. it is pending,
+        not yet reminded, and due within `window` seconds. Only integer comparisons, no parsing.
         """
-        return {
-            "name": self.name,
-            "due_date": self.due_date,
-            "description": self.description,
-            "next_step": self.next_step,
-            "priority": self.priority,
-            "completed": self.completed,
-            "reminded": self.reminded
-        }
+        return (not self.completed and not self.reminded and self.due_date is not None
+                and now_ts >= self.due_date - window)
 
-    @classmethod
-    def from_dict(cls, data):
+
+def _due_sort_key(task):
+    """Due time for sorting; tasks without a valid due date sort last."""
+    return task.due_date if task.due_date is not None else float("inf")
+
+def _task_sort_key(task):
+    """List order: incomplete before completed, then by priority, then by due time (unparseable dates last)."""
+    return (task.completed, _PRIORITY_ORDER.get(task.priority, 99), _due_sort_key(task))
+
+
+# --- User Data Store ---
+class UserStore:
+    """
+    Owns the users data shared by the login and sign up windows and the main UI's lookup
+    of the logged-in user's contact details; all of them use it from the GUI thread.
+    The JSON file is parsed lazily, re-read only when its mtime changes, and written
+    through on every mutation. Writes are copy-on-write: the cached dict is only
+    replaced once the new file is in place.
+    """
+    LOAD_ERROR_MESSAGE = ("Error reading user data file. Existing accounts can't be used "
+                          "and no changes will be saved until the file is fixed.")
+
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+        self._mtime = 0
+        self.load_error = None # LOAD_ERROR_MESSAGE while the file on disk can't be parsed
+
+    def get(self):
+        """Returns the users dict, re-reading the file only if it changed on disk."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            self._data, self._mtime, self.load_error = {}, 0, None
+            return self._data
+        if self._data is None or mtime != self._mtime:
+            try:
+                with open(self.path, "rb") as f:
+                    self._data = json_loads(f.read())
+                self.load_error = None
+            except json.JSONDecodeError as e:
+                logger.error("Error reading user data file: %s", e)
+                self._data = {}
+                self.load_error = self.LOAD_ERROR_MESSAGE
+            self._mtime = mtime
+        return self._data
+
+    def add(self, username, record):
         """
-        Creates a Task object from a dictionary (e.g., loaded from JSON).
-        Uses .get() for optional fields to handle older data structures gracefully.
+        Adds (or replaces) a user record and writes the store to disk.
+        Raises like save(); on failure the cached users are left unchanged.
         """
-        return cls(
-            data["name"],
-            data["due_date"],
-            data.get("description", ""),
-            data.get("next_step", ""),
-            data.get("priority", "Medium"),
-            data.get("completed", False),
-            data.get("reminded", False)
-        )
+        users = dict(self.get())
+        users[username] = record
+        self.save(users)
+
+    def save(self, users):
+        """
+        Writes `users` to disk as compact JSON and makes it the cached dict. The data goes to a
+        temporary file that is swapped in with os.replace, so users.json is never left half-written.
+        Raises OSError on failure, or ValueError if the existing file could not be parsed
+        (writing would throw away every account in it).
+        """
+        if self.load_error:
+            raise ValueError(self.load_error)
+        tmp_file = self.path + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(json_dumps(users))
+        os.replace(tmp_file, self.path)
+        self._data = users
+        self._mtime = os.stat(self.path).st_mtime_ns
+
+    def verify_password(self, username, password):
+        """
+        Checks a password against the stored hash for the given user.
+        Legacy SHA-256 hashes are upgraded to Argon2id on a successful match.
+        """
+        record = self.get().get(username)
+        if record is None:
+            try: # Same Argon2 work as a real account, so response time doesn't reveal which usernames exist
+                _ph.verify(_DUMMY_HASH, password)
+            except (VerificationError, InvalidHashError):
+                pass
+            return False
+
+        stored_hash = record["password"]
+        if not stored_hash.startswith("$argon2"):
+            if not hmac.compare_digest(stored_hash, hashlib.sha256(password.encode()).hexdigest()):
+                return False
+        else:
+            try:
+                _ph.verify(stored_hash, password)
+            except (VerificationError, InvalidHashError):
+                return False
+            if not _ph.check_needs_rehash(stored_hash):
+                return True
+
+        try:
+            self.add(username, dict(record, password=_ph.hash(password)))
+        except (OSError, ValueError) as e:
+            logger.error("Failed to upgrade password hash for %s: %s", username, e)
+        return True
 
 
 # --- Custom UI Components ---
 class CustomMessageBox(QMessageBox):
     """
     Custom styled QMessageBox for consistent UI across the application.
-    Applies a dark theme to the message box itself and its buttons.
+    Its dark theme comes from the QMessageBox rules in APP_QSS.
     """
-    def __init__(self, parent=None):
+    def show_message(self, title, message, icon=QMessageBox.Information, buttons=QMessageBox.Ok):
+        """Sets up the box for one message and runs it modally, returning the clicked button."""
+        self.setWindowTitle(title)
+        self.setText(message)
+        self.setIcon(icon)
+        self.setStandardButtons(buttons)
+        return self.exec_()
+
+    @classmethod
+    def show_for(cls, widget, title, message, icon=QMessageBox.Information, buttons=QMessageBox.Ok):
+        """
+        Shows a message over `widget` using the box cached in its `_message_box`, creating it on first use.
+        A box that is already open, e.g. when a timer fires under a reminder dialog, can't be exec'd again,
+        so that message gets a stand-in box which deletes itself once closed.
+        """
+        box = widget._message_box
+        if box is None:
+            box = widget._message_box = cls(widget)
+        elif box.isVisible():
+            box = cls(widget)
+            box.setAttribute(Qt.WA_DeleteOnClose)
+        return box.show_message(title, message, icon, buttons)
+
+
+class TaskListModel(QAbstractListModel):
+    """
+    List model over a task list kept in display order (see _task_sort_key): pending tasks,
+    a "Completed Tasks" separator row while both groups are non-empty, then completed tasks.
+    Row text is produced on demand when the view paints, so there are no per-row item objects.
+    """
+    SEPARATOR_TEXT = "--- Completed Tasks ---"
+
+    def __init__(self, tasks, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("""
-            QMessageBox {
-                background-color: #3c3c3c;
-                color: #e0e0e0;
-                font-family: "Segoe UI", Arial, sans-serif;
-                font-size: 14px;
-            }
-            QMessageBox QLabel {
-                color: #e0e0e0;
-            }
-            QMessageBox QPushButton {
-                background-color: #6a9de3;
-                border: none;
-                border-radius: 5px;
-                padding: 7px 15px;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #7ab0ff;
-            }
-            QMessageBox QPushButton:pressed {
-                background-color: #5d8edb;
-            }
-        """)
+        self.set_tasks(tasks)
+
+    def set_tasks(self, tasks):
+        """Shows a new (already sorted) task list, resetting any attached views."""
+        self.beginResetModel()
+        self.tasks = tasks
+        self._first_completed = bisect.bisect_left(tasks, True, key=attrgetter("completed")) # Index in tasks
+        self._has_separator = 0 < self._first_completed < len(tasks)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.tasks) + self._has_separator
+
+    def row_of(self, index):
+        """Maps an index into self.tasks to its row; completed tasks sit one lower under the separator."""
+        return index + 1 if self._has_separator and index >= self._first_completed else index
+
+    def task_at(self, row):
+        """Returns the Task shown in a row, or None for the separator row."""
+        if self._has_separator and row >= self._first_completed:
+            return self.tasks[row - 1] if row > self._first_completed else None
+        return self.tasks[row]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self.task_at(index.row())
+        if task is None:
+            if role == Qt.DisplayRole:
+                return self.SEPARATOR_TEXT
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+            if role == Qt.ForegroundRole:
+                return QColor(Qt.gray)
+            return None
+        if role == Qt.DisplayRole:
+            text = f"{task.name} (Due: {task.due_date_text()}) [Priority: {task.priority}]"
+            return "✓ " + text if task.completed else text
+        return None
+
+    def flags(self, index):
+        if index.isValid() and self.task_at(index.row()) is None:
+            return Qt.NoItemFlags
+        return super().flags(index)
+
+    def insert_task(self, task):
+        """Inserts a task at its sorted position, announcing just that row. Returns its QModelIndex."""
+        index = bisect.bisect_right(self.tasks, _task_sort_key(task), key=_task_sort_key)
+        row = self.row_of(index) if task.completed else index
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.tasks.insert(index, task)
+        if not task.completed:
+            self._first_completed += 1
+        self.endInsertRows()
+        self.update_separator()
+        return self.index(self.row_of(index))
+
+    def remove_task(self, task):
+        """Removes a task, announcing just its row."""
+        index = self.tasks.index(task)
+        row = self.row_of(index)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.tasks[index]
+        if not task.completed:
+            self._first_completed -= 1
+        self.endRemoveRows()
+        self.update_separator()
+
+    def update_separator(self):
+        """Shows the separator row only while both pending and completed tasks exist."""
+        needed = 0 < self._first_completed < len(self.tasks)
+        if needed != self._has_separator:
+            row = self._first_completed
+            if needed:
+                self.beginInsertRows(QModelIndex(), row, row)
+            else:
+                self.beginRemoveRows(QModelIndex(), row, row)
+            self._has_separator = needed
+            if needed:
+                self.endInsertRows()
+            else:
+                self.endRemoveRows()
 
 
 # --- Login Window ---
 class LoginWindow(QWidget):
-    def __init__(self, main_app_stacked_widget):
+    def __init__(self, main_app_stacked_widget, user_store, main_ui):
         super().__init__()
         self.main_app_stacked_widget = main_app_stacked_widget
-        self.users_file = "users.json"
+        self.user_store = user_store
+        self.main_ui = main_ui # MainTaskManagerUI that takes over after login
+        self._message_box = None # Created on first use by CustomMessageBox.show_for
         self.init_ui()
-        self.apply_stylesheet()
 
     def init_ui(self):
         self.setWindowTitle("Login")
@@ -179,18 +728,15 @@ class LoginWindow(QWidget):
 
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Username")
-        self.username_input.setFont(QFont("Segoe UI", 12))
         login_layout.addWidget(self.username_input)
 
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Password")
         self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setFont(QFont("Segoe UI", 12))
         login_layout.addWidget(self.password_input)
 
         login_button = QPushButton("Login")
         login_button.setObjectName("primaryButton")
-        login_button.setFont(QFont("Segoe UI", 12, QFont.Bold))
         login_button.clicked.connect(self.login_user)
         login_layout.addWidget(login_button)
 
@@ -208,90 +754,19 @@ class LoginWindow(QWidget):
 
         main_layout.addStretch()
 
-    def apply_stylesheet(self):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                color: #e0e0e0;
-                font-family: "Segoe UI", "Helvetica Neue", Arial, sans-serif;
-                font-size: 14px;
-            }
-            QFrame#loginFrame {
-                background-color: #3c3c3c;
-                border-radius: 15px;
-                padding: 20px;
-                min-width: 300px;
-            }
-            QLabel#loginTitle {
-                font-size: 24px;
-                font-weight: bold;
-                color: #6a9de3;
-                margin-bottom: 20px;
-            }
-            QLabel#loginPrompt {
-                font-size: 13px;
-                color: #bbbbbb;
-            }
-            QLineEdit {
-                background-color: #4a4a4a;
-                border: 1px solid #5c5c5c;
-                border-radius: 8px;
-                padding: 10px;
-                color: #e0e0e0;
-                selection-background-color: #6a9de3;
-            }
-            QLineEdit:focus {
-                border: 1px solid #6a9de3;
-                background-color: #404040;
-            }
-            QPushButton#primaryButton {
-                background-color: #6a9de3;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 20px;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QPushButton#primaryButton:hover {
-                background-color: #7ab0ff;
-            }
-            QPushButton#primaryButton:pressed {
-                background-color: #5d8edb;
-            }
-            QPushButton#tertiaryButtonSmall {
-                background-color: transparent;
-                border: none;
-                color: #7a6ae3;
-                font-weight: bold;
-                padding: 5px;
-            }
-            QPushButton#tertiaryButtonSmall:hover {
-                color: #8f7aff;
-                text-decoration: underline;
-            }
-        """)
-
-    def show_message_box(self, title, message, icon=QMessageBox.Information, buttons=QMessageBox.Ok):
-        msg = CustomMessageBox(self)
-        msg.setWindowTitle(title)
-        msg.setText(message)
-        msg.setIcon(icon)
-        msg.setStandardButtons(buttons)
-        return msg.exec_()
+        self._inputs = [self.username_input, self.password_input]
 
-    def hash_password(self, password):
-        return hashlib.sha256(password.encode()).hexdigest()
+    def clear_inputs(self):
+        """Clears every input field, with signals blocked so each clear() doesn't emit textChanged."""
+        for field in self._inputs:
+            field.blockSignals(True)
+            field.clear()
+            field.blockSignals(False)
 
-    def load_users(self):
-        try:
-            with open(self.users_file, "r") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {}
-        except json.JSONDecodeError:
-            self.show_message_box("Error", "Error reading user data file. Starting with no users.", QMessageBox.Critical)
-            return {}
+    def show_message_box(self, title, message, icon=QMessageBox.Information, buttons=QMessageBox.Ok):
+        return CustomMessageBox.show_for(self, title, message, icon, buttons)
 
+    @pyqtSlot()
     def login_user(self):
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
@@ -300,33 +775,35 @@ class LoginWindow(QWidget):
             self.show_message_box("Login Error", "Please enter both username and password.", QMessageBox.Warning)
             return
 
-        users = self.load_users()
-        hashed_password = self.hash_password(password)
+        self.user_store.get()
+        if self.user_store.load_error:
+            self.show_message_box("Error", self.user_store.load_error, QMessageBox.Critical)
+            return
 
-        if username in users and users[username]["password"] == hashed_password:
+        if self.user_store.verify_password(username, password):
             self.show_message_box("Login Success", f"Welcome, {username}!", QMessageBox.Information)
-            # Find the MainTaskManagerUI instance and set the current user
-            self.main_app_stacked_widget.findChild(MainTaskManagerUI).set_current_user(username)
+            self.main_ui.set_current_user(username)
             self.main_app_stacked_widget.setCurrentIndex(2) # Show MainTaskManagerUI
-            self.username_input.clear()
-            self.password_input.clear()
+            self.clear_inputs()
+            # The auth pages are never shown again; free them once this handler has returned
+            QTimer.singleShot(0, self.main_app_stacked_widget.tear_down_auth_pages)
         else:
             self.show_message_box("Login Failed", "Invalid username or password.", QMessageBox.Critical)
 
+    @pyqtSlot()
     def show_signup_page(self):
         self.main_app_stacked_widget.setCurrentIndex(1) # Show SignUpWindow
-        self.username_input.clear()
-        self.password_input.clear()
+        self.clear_inputs()
 
 
 # --- Sign Up Window ---
 class SignUpWindow(QWidget):
-    def __init__(self, main_app_stacked_widget):
+    def __init__(self, main_app_stacked_widget, user_store):
         super().__init__()
         self.main_app_stacked_widget = main_app_stacked_widget
-        self.users_file = "users.json"
+        self.user_store = user_store
+        self._message_box = None # Created on first use by CustomMessageBox.show_for
         self.init_ui()
-        self.apply_stylesheet()
 
     def init_ui(self):
         self.setWindowTitle("Sign Up")
@@ -349,35 +826,29 @@ class SignUpWindow(QWidget):
 
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Username")
-        self.username_input.setFont(QFont("Segoe UI", 11))
         signup_layout.addWidget(self.username_input)
 
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("Email Address (Optional)")
-        self.email_input.setFont(QFont("Segoe UI", 11))
         signup_layout.addWidget(self.email_input)
 
         # New: Phone number input field
         self.phone_number_input = QLineEdit()
         self.phone_number_input.setPlaceholderText("Mobile Number (e.g., +1234567890)")
-        self.phone_number_input.setFont(QFont("Segoe UI", 11))
         signup_layout.addWidget(self.phone_number_input)
 
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Password")
         self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setFont(QFont("Segoe UI", 11))
         signup_layout.addWidget(self.password_input)
 
         self.retype_password_input = QLineEdit()
         self.retype_password_input.setPlaceholderText("Retype Password")
         self.retype_password_input.setEchoMode(QLineEdit.Password)
-        self.retype_password_input.setFont(QFont("Segoe UI", 11))
         signup_layout.addWidget(self.retype_password_input)
 
         signup_button = QPushButton("Sign Up")
         signup_button.setObjectName("primaryButton")
-        signup_button.setFont(QFont("Segoe UI", 12, QFont.Bold))
         signup_button.clicked.connect(self.register_user)
         signup_layout.addWidget(signup_button)
 
@@ -388,93 +859,20 @@ class SignUpWindow(QWidget):
 
         main_layout.addStretch()
 
-    def apply_stylesheet(self):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                color: #e0e0e0;
-                font-family: "Segoe UI", "Helvetica Neue", Arial, sans-serif;
-                font-size: 14px;
-            }
-            QFrame#signupFrame {
-                background-color: #3c3c3c;
-                border-radius: 15px;
-                padding: 20px;
-                min-width: 350px;
-            }
-            QLabel#signupTitle {
-                font-size: 24px;
-                font-weight: bold;
-                color: #e39d6a; /* Orange highlight for signup */
-                margin-bottom: 20px;
-            }
-            QLineEdit {
-                background-color: #4a4a4a;
-                border: 1px solid #5c5c5c;
-                border-radius: 8px;
-                padding: 10px;
-                color: #e0e0e0;
-                selection-background-color: #6a9de3;
-            }
-            QLineEdit:focus {
-                border: 1px solid #6a9de3;
-                background-color: #404040;
-            }
-            QPushButton#primaryButton {
-                background-color: #6a9de3;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 20px;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QPushButton#primaryButton:hover {
-                background-color: #7ab0ff;
-            }
-            QPushButton#primaryButton:pressed {
-                background-color: #5d8edb;
-            }
-            QPushButton#tertiaryButtonSmall {
-                background-color: transparent;
-                border: none;
-                color: #7a6ae3;
-                font-weight: bold;
-                padding: 5px;
-            }
-            QPushButton#tertiaryButtonSmall:hover {
-                color: #8f7aff;
-                text-decoration: underline;
-            }
-        """)
-
-    def show_message_box(self, title, message, icon=QMessageBox.Information, buttons=QMessageBox.Ok):
-        msg = CustomMessageBox(self)
-        msg.setWindowTitle(title)
-        msg.setText(message)
-        msg.setIcon(icon)
-        msg.setStandardButtons(buttons)
-        return msg.exec_()
+        self._inputs = [self.username_input, self.email_input, self.phone_number_input,
+                        self.password_input, self.retype_password_input]
 
-    def hash_password(self, password):
-        return hashlib.sha256(password.encode()).hexdigest()
+    def clear_inputs(self):
+        """Clears every input field, with signals blocked so each clear() doesn't emit textChanged."""
+        for field in self._inputs:
+            field.blockSignals(True)
+            field.clear()
+            field.blockSignals(False)
 
-    def load_users(self):
-        try:
-            with open(self.users_file, "r") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {}
-        except json.JSONDecodeError:
-            self.show_message_box("Error", "Error reading user data file. Starting with no users.", QMessageBox.Critical)
-            return {}
-
-    def save_users(self, users_data):
-        try:
-            with open(self.users_file, "w") as f:
-                json.dump(users_data, f, indent=4)
-        except Exception as e:
-            self.show_message_box("Error", f"Failed to save user data: {e}", QMessageBox.Critical)
+    def show_message_box(self, title, message, icon=QMessageBox.Information, buttons=QMessageBox.Ok):
+        return CustomMessageBox.show_for(self, title, message, icon, buttons)
 
+    @pyqtSlot()
     def register_user(self):
         username = self.username_input.text().strip()
         email = self.email_input.text().strip()
@@ -492,53 +890,118 @@ class SignUpWindow(QWidget):
             self.show_message_box("Sign Up Error", "Password must be at least 6 characters long.", QMessageBox.Warning)
             return
 
-        users = self.load_users()
+        users = self.user_store.get()
+        if self.user_store.load_error:
+            self.show_message_box("Error", self.user_store.load_error, QMessageBox.Critical)
+            return
         if username in users:
             self.show_message_box("Sign Up Error", "Username already exists. Please choose a different one.", QMessageBox.Warning)
             return
 
-        hashed_password = self.hash_password(password)
+        hashed_password = _ph.hash(password)
         # Store phone number with user data
-        users[username] = {"password": hashed_password, "email": email, "phone_number": phone_number}
-        self.save_users(users)
+        try:
+            self.user_store.add(username, {"password": hashed_password, "email": email, "phone_number": phone_number})
+        except Exception as e:
+            self.show_message_box("Error", f"Failed to save user data: {e}", QMessageBox.Critical)
+            return
         self.show_message_box("Sign Up Success", "Account created successfully! You can now log in.", QMessageBox.Information)
         self.show_login_page() # Go back to login page after successful signup
 
+    @pyqtSlot()
     def show_login_page(self):
         self.main_app_stacked_widget.setCurrentIndex(0) # Show LoginWindow
-        self.username_input.clear()
-        self.email_input.clear()
-        self.phone_number_input.clear() # Clear phone number field
-        self.password_input.clear()
-        self.retype_password_input.clear()
+        self.clear_inputs()
 
 
 # --- Main Task Manager UI (Encapsulated) ---
 class MainTaskManagerUI(QWidget):
+    notification_failed = pyqtSignal(str, str) # (title, message), emitted from notification workers
+    tasks_save_failed = pyqtSignal(str) # Error message, emitted from the save thread
+
+    DETAILS_TEMPLATE = (
+        "<div style='line-height: 160%;'>"
+        "<b>Task:</b> {name}<br>"
+        "<b>Due:</b> {due_date}<br>"
+        "<b>Description:</b> {description}<br>"
+        "<b>Next Step:</b> {next_step}<br>"
+        "<b>Priority:</b> {priority}<br>"
+        "<b>Status:</b> {status}"
+        "</div>"
+    )
+
+    # Email and SMS credentials come from the environment; an empty value disables that channel
+    SENDER_EMAIL = os.environ.get("TASK_MANAGER_SENDER_EMAIL", "")
+    SENDER_EMAIL_PASSWORD = os.environ.get("TASK_MANAGER_SENDER_EMAIL_PASSWORD", "") # App Password for Gmail
+    TWILIO_ACCOUNT_SID = os.environ.get("TWILIO_ACCOUNT_SID", "")
+    TWILIO_AUTH_TOKEN = os.environ.get("TWILIO_AUTH_TOKEN", "")
+    TWILIO_PHONE_NUMBER = os.environ.get("TWILIO_PHONE_NUMBER", "")
+    EMAIL_ENABLED = bool(SENDER_EMAIL and SENDER_EMAIL_PASSWORD)
+    SMS_ENABLED = bool(TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN and TWILIO_PHONE_NUMBER)
+
+    REMINDER_MAX_INTERVAL = 60 * 60 # Seconds; upper bound on the time between reminder checks
+
     def __init__(self):
         super().__init__()
-        self.tasks = []
+        self.tasks = [] # Kept in display order (see _task_sort_key)
+        self._active_tasks = [] # Tasks still waiting for their reminder, sorted by due time
+        self._message_box = None # Created on first use by CustomMessageBox.show_for
         self.current_user = None
+        self._recipient_email = None # Current user's email and phone number, looked up once at login
+        self._recipient_phone = None
         self.data_file_prefix = "_tasks.json"
         
+        self.setup_reminder_timer() # Before init_ui, whose initial refresh re-arms it
         self.init_ui()
-        self.apply_stylesheet()
-        self.setup_reminder_timer()
+
+        # Task saves are debounced and written by a single background thread, which keeps them in order
+        self._save_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.flush_tasks)
+        self.tasks_save_failed.connect(self.show_save_error)
         
         # Initialize voice recognition if available
         try:
             self.init_voice_recognition()
             self.voice_enabled = True
         except Exception as e:
-            print(f"Voice recognition not available: {e}")
+            logger.warning("Voice recognition not available: %s", e)
             self.voice_enabled = False
 
-        # Email and SMS config remains the same
-        self.SENDER_EMAIL = "your_email@gmail.com"
-        self.SENDER_EMAIL_PASSWORD = "your_app_password"
-        self.TWILIO_ACCOUNT_SID = "ACxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
-        self.TWILIO_AUTH_TOKEN = "your_auth_token"
-        self.TWILIO_PHONE_NUMBER = "+1234567890"
+        # Optional notification libraries, imported lazily (False once known to be missing)
+        self._twilio_client_class = None
+        self._plyer_notification = None
+
+        # Reused across reminders instead of reconnecting for every message
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        self._twilio_client = None
+
+        self.notification_failed.connect(self.show_notification_error)
+
+    def get_twilio_client_class(self):
+        """Imports Twilio on first use. Returns its Client class, or None if it isn't installed."""
+        if self._twilio_client_class is None:
+            try:
+                from twilio.rest import Client
+                self._twilio_client_class = Client
+            except ImportError:
+                logger.warning("Twilio library not found. SMS notifications will not be available. Please install it using 'pip install twilio'.")
+                self._twilio_client_class = False
+        return self._twilio_client_class or None
+
+    def get_plyer_notification(self):
+        """Imports Plyer on first use. Returns its notification facade, or None if it isn't installed."""
+        if self._plyer_notification is None:
+            try:
+                from plyer import notification
+                self._plyer_notification = notification
+            except ImportError:
+                logger.warning("Plyer library not found. Native desktop notifications will not be available. Please install it using 'pip install plyer'.")
+                self._plyer_notification = False
+        return self._plyer_notification or None
 
     def init_voice_recognition(self):
         """Initialize voice recognition components."""
@@ -555,6 +1018,7 @@ class MainTaskManagerUI(QWidget):
         # Add the voice button to your existing button layout
         self.button_layout.addWidget(self.voice_button)
 
+    @pyqtSlot()
     def toggle_voice_recognition(self):
         """Start or stop voice recognition."""
         if not self.voice_enabled:
@@ -569,10 +1033,11 @@ class MainTaskManagerUI(QWidget):
         threading.Thread(target=self.voice_thread.listen, daemon=True).start()
         self.show_message_box("Listening", "Speak your command now...", QMessageBox.Information)
 
+    @pyqtSlot(str)
     def process_voice_command(self, command):
         """Process the recognized voice command."""
         command = command.lower().strip()
-        print(f"Voice command recognized: {command}")
+        logger.info("Voice command recognized: %s", command)
         
         if not command or "could not" in command or "error" in command.lower():
             self.show_message_box("Voice Error", 
@@ -610,32 +1075,42 @@ class MainTaskManagerUI(QWidget):
                                "- Clear\n- Show tasks\n- Exit", 
                                QMessageBox.Information)
             
+    @pyqtSlot()
     def check_external_service_configs(self):
-        """Checks if external service credentials are still default placeholders and warns the user."""
+        """
+        Checks if external service credentials are missing from the environment and warns the user.
+        Scheduled once from set_current_user, and only when a channel is not configured.
+        """
         warnings = []
-        if self.SENDER_EMAIL == "your_email@gmail.com" or self.SENDER_EMAIL_PASSWORD == "your_app_password":
-            warnings.append("Email sender credentials are not configured. Email reminders will not be sent.")
+        if not self.EMAIL_ENABLED:
+            warnings.append("Email sender credentials are not configured. Email reminders will not be sent.\n"
+                            "Set TASK_MANAGER_SENDER_EMAIL and TASK_MANAGER_SENDER_EMAIL_PASSWORD.")
         
-        if self.TWILIO_ACCOUNT_SID == "ACxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" or \
-           self.TWILIO_AUTH_TOKEN == "your_auth_token" or \
-           self.TWILIO_PHONE_NUMBER == "+1234567890":
-            warnings.append("Twilio SMS credentials are not configured. SMS reminders will not be sent.")
+        if not self.SMS_ENABLED:
+            warnings.append("Twilio SMS credentials are not configured. SMS reminders will not be sent.\n"
+                            "Set TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN and TWILIO_PHONE_NUMBER.")
 
         if warnings:
-            self.show_message_box(
-                "Configuration Warning",
-                "Please configure the following external service credentials in the MainTaskManagerUI class:\n\n" + "\n".join(warnings),
-                QMessageBox.Warning
-            )
+            message = "Please set the following external service credentials as environment variables:\n\n" + "\n\n".join(warnings)
+            logger.warning(message)
+            self.show_message_box("Configuration Warning", message, QMessageBox.Warning)
 
     def set_current_user(self, username):
         """Sets the current user and loads their tasks."""
+        if self._save_timer.isActive(): # Don't lose the previous user's pending changes
+            self.flush_tasks()
         self.current_user = username
+        user = MainTaskManagerApp.load_users_from_file().get(username, {})
+        self._recipient_email = user.get("email")
+        self._recipient_phone = user.get("phone_number")
         self.load_tasks()
         self.refresh_task_list()
+        if not (self.EMAIL_ENABLED and self.SMS_ENABLED):
+            QTimer.singleShot(0, self.check_external_service_configs) # After the welcome message is up
         self.show_message_box("Welcome", f"Logged in as {self.current_user}", QMessageBox.Information)
 
     def init_ui(self):
+        self.setUpdatesEnabled(False) # No paint/layout passes while the widget tree is being built
         self.main_layout = QHBoxLayout()
         self.setLayout(self.main_layout)
 
@@ -704,10 +1179,13 @@ class MainTaskManagerUI(QWidget):
         self.main_layout.addWidget(self.list_container, 2)
 
         self.list_layout.addWidget(self.create_label("Your Tasks:", "h1"))
-        self.task_list_widget = QListWidget()
-        self.task_list_widget.setObjectName("taskList")
-        self.task_list_widget.itemSelectionChanged.connect(self.display_selected_task_details)
-        self.list_layout.addWidget(self.task_list_widget)
+        self.task_model = TaskListModel(self.tasks, self)
+        self.task_list_view = QListView()
+        self.task_list_view.setObjectName("taskList")
+        self.task_list_view.setUniformItemSizes(True) # All rows are one line; lets the view skip per-row size queries
+        self.task_list_view.setModel(self.task_model)
+        self.task_list_view.selectionModel().selectionChanged.connect(self.display_selected_task_details)
+        self.list_layout.addWidget(self.task_list_view)
 
         self.list_action_buttons_layout = QHBoxLayout()
         self.list_layout.addLayout(self.list_action_buttons_layout)
@@ -735,22 +1213,14 @@ class MainTaskManagerUI(QWidget):
         self.task_details_layout.setContentsMargins(15, 15, 15, 15)
         self.task_details_stacked_widget.addWidget(self.task_details_widget)
 
-        self.detail_name_label = self.create_label("<b>Task:</b>", "detail")
-        self.task_details_layout.addWidget(self.detail_name_label)
-        self.detail_due_label = self.create_label("<b>Due:</b>", "detail")
-        self.task_details_layout.addWidget(self.detail_due_label)
-        self.detail_desc_label = self.create_label("<b>Description:</b>", "detail")
-        self.task_details_layout.addWidget(self.detail_desc_label)
-        self.detail_next_step_label = self.create_label("<b>Next Step:</b>", "detail")
-        self.task_details_layout.addWidget(self.detail_next_step_label)
-        self.detail_priority_label = self.create_label("<b>Priority:</b>", "detail")
-        self.task_details_layout.addWidget(self.detail_priority_label)
-        self.detail_status_label = self.create_label("<b>Status:</b>", "detail")
-        self.task_details_layout.addWidget(self.detail_status_label)
+        # A single rich-text label filled from DETAILS_TEMPLATE: one setText and one layout pass per selection
+        self.detail_label = self.create_label("", "detail")
+        self.task_details_layout.addWidget(self.detail_label)
 
         self.task_details_layout.addStretch()
 
         self.refresh_task_list()
+        self.setUpdatesEnabled(True)
 
     def create_label(self, text, style_class=""):
         label = QLabel(text)
@@ -758,246 +1228,17 @@ class MainTaskManagerUI(QWidget):
             label.setObjectName(style_class)
         return label
 
-    def apply_stylesheet(self):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                color: #e0e0e0;
-                font-family: "Segoe UI", "Helvetica Neue", Arial, sans-serif;
-                font-size: 14px;
-            }
-
-            /* Container Frames */
-            QFrame#inputContainer, QFrame#listContainer {
-                background-color: #3c3c3c;
-                border-radius: 10px;
-                padding: 10px;
-            }
-
-            QFrame#detailsPanel {
-                background-color: #4a4a4a;
-                border-radius: 8px;
-                border: 1px solid #555555;
-            }
-
-            /* Labels */
-            QLabel {
-                color: #f0f0f0;
-                font-weight: 500;
-            }
-            QLabel#h1 {
-                font-size: 20px;
-                font-weight: bold;
-                color: #6a9de3;
-                margin-bottom: 5px;
-            }
-            QLabel#detail {
-                font-size: 13px;
-                color: #d0d0d0;
-            }
-            QLabel#placeholder {
-                color: #999999;
-                font-style: italic;
-                font-size: 16px;
-            }
-
-
-            /* LineEdits (Task Name, Next Step) */
-            QLineEdit, QTextEdit {
-                background-color: #4a4a4a;
-                border: 1px solid #5c5c5c;
-                border-radius: 5px;
-                padding: 8px;
-                color: #e0e0e0;
-                selection-background-color: #6a9de3;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border: 1px solid #6a9de3;
-                background-color: #404040;
-            }
-
-            /* QTextEdit */
-            QTextEdit {
-                min-height: 80px;
-            }
-
-            /* QDateTimeEdit */
-            QDateTimeEdit {
-                background-color: #4a4a4a;
-                border: 1px solid #5c5c5c;
-                border-radius: 5px;
-                padding: 8px;
-                color: #e0e0e0;
-                selection-background-color: #6a9de3;
-            }
-            QDateTimeEdit::drop-down {
-                border: 0px;
-                subcontrol-origin: padding;
-                subcontrol-position: center right;
-                width: 20px;
-            }
-            QDateTimeEdit::down-arrow {
-                width: 0px;
-                height: 0px;
-            }
-
-            /* QComboBox (Priority) */
-            QComboBox {
-                background-color: #4a4a4a;
-                border: 1px solid #5c5c5c;
-                border-radius: 5px;
-                padding: 8px;
-                color: #e0e0e0;
-                selection-background-color: #6a9de3;
-            }
-            QComboBox::drop-down {
-                border: 0px;
-                subcontrol-origin: padding;
-                subcontrol-position: center right;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                width: 0px;
-                height: 0px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #4a4a4a;
-                border: 1px solid #6a9de3;
-                selection-background-color: #6a9de3;
-                color: #e0e0e0;
-            }
-
-
-            /* Buttons */
-            QPushButton {
-                background-color: #5c5c5c;
-                border: none;
-                border-radius: 7px;
-                padding: 10px 15px;
-                color: #ffffff;
-                font-weight: bold;
-            }
-
-            QPushButton:hover {
-                background-color: #6a6a6a;
-            }
-
-            QPushButton:pressed {
-                background-color: #4a4a4a;
-            }
-
-            QPushButton:disabled {
-                background-color: #3a3a3a;
-                color: #888888;
-            }
-
-            /* Specific button styles */
-            QPushButton#primaryButton {
-                background-color: #6a9de3;
-            }
-            QPushButton#primaryButton:hover {
-                background-color: #7ab0ff;
-            }
-            QPushButton#primaryButton:pressed {
-                background-color: #5d8edb;
-            }
-
-            QPushButton#secondaryButton {
-                background-color: #e39d6a;
-            }
-            QPushButton#secondaryButton:hover {
-                background-color: #ffb07a;
-            }
-            QPushButton#secondaryButton:pressed {
-                background-color: #db8e5d;
-            }
-
-            QPushButton#tertiaryButton {
-                background-color: #7a6ae3;
-            }
-            QPushButton#tertiaryButton:hover {
-                background-color: #8f7aff;
-            }
-            QPushButton#tertiaryButton:pressed {
-                background-color: #6e5edb;
-            }
-
-            QPushButton#actionButton {
-                background-color: #555555;
-            }
-            QPushButton#actionButton:hover {
-                background-color: #666666;
-            }
-            QPushButton#actionButton:pressed {
-                background-color: #444444;
-            }
-
-            /* Voice Button */
-            QPushButton#voiceButton {
-                background-color: #6a9de3;
-                border: none;
-                border-radius: 8px;
-                padding: 8px;
-                min-width: 36px;
-                min-height: 36px;
-            }
-            QPushButton#voiceButton:hover {
-                background-color: #7ab0ff;
-            }
-            QPushButton#voiceButton:pressed {
-                background-color: #5d8edb;
-            }
-            QPushButton#voiceButton:disabled {
-                background-color: #555555;
-            }
-
-
-            /* QListWidget (Task List) */
-            QListWidget {
-                background-color: #4a4a4a;
-                border: 1px solid #5c5c5c;
-                border-radius: 8px;
-                padding: 5px;
-                outline: 0;
-            }
-
-            QListWidget::item {
-                padding: 8px 10px;
-                margin-bottom: 3px;
-                border-radius: 5px;
-                color: #e0e0e0;
-                background-color: #555555;
-            }
-
-            QListWidget::item:selected {
-                background-color: #6a9de3;
-                color: #ffffff;
-                border: 1px solid #6a9de3;
-            }
-
-            QListWidget::item:hover:!selected {
-                background-color: #606060;
-            }
-
-            /* Style for completed tasks in the list */
-            QListWidget::item[completed="true"] {
-                color: #aaaaaa;
-                background-color: #444444;
-                text-decoration: line-through;
-            }
-        """)
-
     def show_message_box(self, title, message, icon=QMessageBox.Information, buttons=QMessageBox.Ok):
-        msg = CustomMessageBox(self)
-        msg.setWindowTitle(title)
-        msg.setText(message)
-        msg.setIcon(icon)
-        msg.setStandardButtons(buttons)
-        return msg.exec_()
+        return CustomMessageBox.show_for(self, title, message, icon, buttons)
+
+    def due_date_timestamp(self):
+        """Returns the picked due date as a Unix timestamp, truncated to the minute like the picker's display."""
+        return self.due_date_input.dateTime().toSecsSinceEpoch() // 60 * 60
 
+    @pyqtSlot()
     def add_task(self):
         name = self.task_name_input.text().strip()
-        due_date_str = self.due_date_input.dateTime().toString("yyyy-MM-dd HH:mm")
+        due_ts = self.due_date_timestamp()
         description = self.description_input.toPlainText().strip()
         next_step = self.next_step_input.text().strip()
         priority = self.priority_input.currentText()
@@ -1006,21 +1247,21 @@ class MainTaskManagerUI(QWidget):
             self.show_message_box("Input Error", "Task name cannot be empty.", QMessageBox.Warning)
             return
 
-        new_task = Task(name, due_date_str, description, next_step, priority, reminded=False)
-        self.tasks.append(new_task)
+        new_task = Task(name, due_ts, description, next_step, priority, reminded=False)
+        self.insert_task(new_task)
         self.save_tasks()
-        self.refresh_task_list()
         self.clear_fields()
         self.show_message_box("Success", f"Task '{name}' added.")
 
+    @pyqtSlot()
     def update_selected_task(self):
-        current_row = self.task_list_widget.currentRow()
-        if current_row < 0:
+        task_to_update = self.selected_task()
+        if task_to_update is None:
             self.show_message_box("Selection Error", "No task selected to update.", QMessageBox.Warning)
             return
 
         name = self.task_name_input.text().strip()
-        due_date_str = self.due_date_input.dateTime().toString("yyyy-MM-dd HH:mm")
+        due_ts = self.due_date_timestamp()
         description = self.description_input.toPlainText().strip()
         next_step = self.next_step_input.text().strip()
         priority = self.priority_input.currentText()
@@ -1029,23 +1270,25 @@ class MainTaskManagerUI(QWidget):
             self.show_message_box("Input Error", "Task name cannot be empty.", QMessageBox.Warning)
             return
 
-        task_to_update = self.tasks[current_row]
+        # Priority and due date decide its list position and its place in the reminder queue, so take it out and re-insert it
+        self.remove_task(task_to_update)
         task_to_update.name = name
-        task_to_update.due_date = due_date_str
+        task_to_update.due_date = due_ts
         task_to_update.description = description
         task_to_update.next_step = next_step
         task_to_update.priority = priority
         task_to_update.reminded = False
+        self.insert_task(task_to_update)
 
         self.save_tasks()
-        self.refresh_task_list()
         self.clear_fields()
         self.update_button.setEnabled(False)
         self.show_message_box("Success", f"Task '{name}' updated.")
 
+    @pyqtSlot()
     def delete_task(self):
-        current_row = self.task_list_widget.currentRow()
-        if current_row < 0:
+        task = self.selected_task()
+        if task is None:
             self.show_message_box("Selection Error", "No task selected to delete.", QMessageBox.Warning)
             return
 
@@ -1057,30 +1300,31 @@ class MainTaskManagerUI(QWidget):
         )
 
         if reply == QMessageBox.Yes:
-            deleted_task_name = self.tasks[current_row].name
-            del self.tasks[current_row]
+            deleted_task_name = task.name
+            self.remove_task(task)
             self.save_tasks()
-            self.refresh_task_list()
             self.clear_fields()
             self.update_button.setEnabled(False)
             self.show_message_box("Success", f"Task '{deleted_task_name}' deleted.")
         else:
             self.show_message_box("Canceled", "Task deletion canceled.")
 
+    @pyqtSlot()
     def mark_task_complete(self):
-        current_row = self.task_list_widget.currentRow()
-        if current_row < 0:
+        task = self.selected_task()
+        if task is None:
             self.show_message_box("Selection Error", "No task selected to mark complete/incomplete.", QMessageBox.Warning)
             return
 
-        task = self.tasks[current_row]
+        # Completion moves the task to the other group of the list
+        self.remove_task(task)
         new_status = not task.completed
         task.completed = new_status
         task.reminded = True
+        index = self.insert_task(task)
 
         self.save_tasks()
-        self.refresh_task_list()
-        self.display_selected_task_details()
+        self.task_list_view.setCurrentIndex(index) # Keeps the task selected; refreshes its details
 
         if new_status:
             self.trigger_completion_notification(task)
@@ -1088,9 +1332,10 @@ class MainTaskManagerUI(QWidget):
         self.show_message_box("Status Update", f"Task '{task.name}' marked as {'Complete' if task.completed else 'Incomplete'}.")
 
 
+    @pyqtSlot()
     def display_selected_task_details(self):
-        selected_items = self.task_list_widget.selectedItems()
-        if not selected_items:
+        task = self.selected_task()
+        if task is None:
             self.task_details_stacked_widget.setCurrentWidget(self.empty_details_page)
             self.clear_fields_internal()
             self.update_button.setEnabled(False)
@@ -1103,29 +1348,38 @@ class MainTaskManagerUI(QWidget):
         self.complete_button.setEnabled(True)
         self.delete_button.setEnabled(True)
 
-        current_row = self.task_list_widget.currentRow()
-        task = self.tasks[current_row]
-
         self.task_name_input.setText(task.name)
-        due_datetime = QDateTime.fromString(task.due_date, "yyyy-MM-dd HH:mm")
+        due_datetime = QDateTime.fromSecsSinceEpoch(task.due_date) if task.due_date is not None else QDateTime.currentDateTime()
         self.due_date_input.setDateTime(due_datetime)
         self.description_input.setText(task.description)
         self.next_step_input.setText(task.next_step)
         self.priority_input.setCurrentText(task.priority)
 
-        self.detail_name_label.setText(f"<b>Task:</b> {task.name}")
-        self.detail_due_label.setText(f"<b>Due:</b> {task.due_date}")
-        self.detail_desc_label.setText(f"<b>Description:</b> {task.description if task.description else 'N/A'}")
-        self.detail_next_step_label.setText(f"<b>Next Step:</b> {task.next_step if task.next_step else 'N/A'}")
-        self.detail_priority_label.setText(f"<b>Priority:</b> {task.priority}")
-        status = "Complete" if task.completed else "Pending"
-        self.detail_status_label.setText(f"<b>Status:</b> {status}")
+        self.detail_label.setText(self.details_html(
+            task.name, task.due_date, task.description, task.next_step, task.priority, task.completed))
 
         self.complete_button.setText(f"Mark as {'Incomplete' if task.completed else 'Complete'}")
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def details_html(name, due_date, description, next_step, priority, completed):
+        """
+        Renders DETAILS_TEMPLATE for a task's field values. Memoized on those values, so moving
+        back and forth through the list reuses the HTML and an edited task simply gets a new entry.
+        """
+        return MainTaskManagerUI.DETAILS_TEMPLATE.format(
+            name=name,
+            due_date=format_due_date(due_date) if due_date is not None else "N/A",
+            description=description if description else 'N/A',
+            next_step=next_step if next_step else 'N/A',
+            priority=priority,
+            status="Complete" if completed else "Pending"
+        )
+
+    @pyqtSlot()
     def clear_fields(self):
         self.clear_fields_internal()
-        self.task_list_widget.clearSelection()
+        self.task_list_view.clearSelection()
         self.task_details_stacked_widget.setCurrentWidget(self.empty_details_page)
         self.update_button.setEnabled(False)
         self.complete_button.setEnabled(False)
@@ -1138,46 +1392,59 @@ class MainTaskManagerUI(QWidget):
         self.next_step_input.clear()
         self.priority_input.setCurrentText("Medium")
 
-    def refresh_task_list(self):
-        self.task_list_widget.clear()
-
-        priority_order = {"High": 0, "Medium": 1, "Low": 2}
-
-        incomplete_tasks = [t for t in self.tasks if not t.completed]
-        completed_tasks = [t for t in self.tasks if t.completed]
+    def selected_task(self):
+        """Returns the Task behind the selected list row, or None if nothing is selected."""
+        selected = self.task_list_view.selectionModel().selectedIndexes()
+        return self.task_model.task_at(selected[0].row()) if selected else None
 
-        incomplete_tasks.sort(key=lambda x: (priority_order.get(x.priority, 99), datetime.strptime(x.due_date, "%Y-%m-%d %H:%M")))
-        completed_tasks.sort(key=lambda x: (priority_order.get(x.priority, 99), datetime.strptime(x.due_date, "%Y-%m-%d %H:%M")))
-
-        for task in incomplete_tasks:
-            item_text = f"{task.name} (Due: {task.due_date}) [Priority: {task.priority}]"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, task)
-            item.setData(Qt.WhatsThisRole, "false")
-            self.task_list_widget.addItem(item)
-
-        if incomplete_tasks and completed_tasks:
-            separator_item = QListWidgetItem("--- Completed Tasks ---")
-            separator_item.setTextAlignment(Qt.AlignCenter)
-            separator_item.setFlags(Qt.NoItemFlags)
-            separator_item.setForeground(Qt.gray)
-            self.task_list_widget.addItem(separator_item)
+    def insert_task(self, task):
+        """
+        Inserts a task into self.tasks at its sorted position, adding just its row to the list.
+        Returns the new row's QModelIndex.
+        """
+        index = self.task_model.insert_task(task)
+        if not task.completed and not task.reminded:
+            bisect.insort(self._active_tasks, task, key=_due_sort_key)
+            if self._active_tasks[0] is task: # Now the next reminder; the timer may be set for a later one
+                self.schedule_next_reminder()
+        return index
+
+    def remove_task(self, task):
+        """Removes a task from self.tasks, taking just its row out of the list."""
+        self.task_model.remove_task(task)
+        if task in self._active_tasks:
+            was_next = self._active_tasks[0] is task
+            self._active_tasks.remove(task)
+            if was_next:
+                self.schedule_next_reminder()
+
+    def sort_tasks(self):
+        """Puts self.tasks in display order and rebuilds the reminder queue from it."""
+        self.tasks.sort(key=_task_sort_key)
+        self._active_tasks = sorted((t for t in self.tasks if not t.completed and not t.reminded), key=_due_sort_key)
+        self.schedule_next_reminder()
 
-        for task in completed_tasks:
-            item_text = f"✓ {task.name} (Due: {task.due_date}) [Priority: {task.priority}]"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, task)
-            item.setData(Qt.WhatsThisRole, "true")
-            self.task_list_widget.addItem(item)
+    def refresh_task_list(self):
+        """
+        Re-sorts self.tasks and resets the list model to it, e.g. after loading a user's tasks.
+        The view only builds the rows it paints, so a reset costs the same however many tasks there are,
+        and nothing at all while this page is hidden.
+        """
+        had_selection = self.task_list_view.selectionModel().hasSelection()
+        self.sort_tasks()
+        self.task_model.set_tasks(self.tasks)
+        if had_selection: # The reset dropped the selection without emitting selectionChanged
+            self.display_selected_task_details()
 
     def load_tasks(self):
         """Loads tasks from the local JSON data file specific to the current user."""
         if self.current_user:
             user_data_file = f"{self.current_user}{self.data_file_prefix}"
             try:
-                with open(user_data_file, "r") as f:
-                    tasks_data = json.load(f)
-                    self.tasks = [Task.from_dict(data) for data in tasks_data]
+                with open(user_data_file, "rb") as f:
+                    tasks_data = json_loads(f.read())
+                    # Unknown keys (e.g. from other versions of the file) are ignored
+                    self.tasks = [Task(**{k: v for k, v in data.items() if k in _TASK_FIELDS}) for data in tasks_data]
             except FileNotFoundError:
                 self.tasks = []
             except json.JSONDecodeError:
@@ -1187,171 +1454,262 @@ class MainTaskManagerUI(QWidget):
             self.tasks = [] # No user logged in, so no tasks loaded
 
     def save_tasks(self):
-        """Saves current tasks to the local JSON data file specific to the current user."""
+        """
+        Schedules a save of the current user's tasks. Changes made within 500 ms of each
+        other are written once, by flush_tasks.
+        """
         if self.current_user:
-            user_data_file = f"{self.current_user}{self.data_file_prefix}"
-            try:
-                with open(user_data_file, "w") as f:
-                    json.dump([task.to_dict() for task in self.tasks], f, indent=4)
-            except Exception as e:
-                self.show_message_box("Save Error", f"Failed to save tasks for {self.current_user}: {e}", QMessageBox.Critical)
+            self._save_timer.start()
         else:
-            print("No user logged in, cannot save tasks.")
+            logger.warning("No user logged in, cannot save tasks.")
+
+    @pyqtSlot()
+    def flush_tasks(self):
+        """
+        Snapshots the current tasks and hands them to the background save thread.
+        Also cancels any pending scheduled save.
+        """
+        self._save_timer.stop()
+        if not self.current_user:
+            return
+        user_data_file = f"{self.current_user}{self.data_file_prefix}"
+        tasks_data = [{field: getattr(task, field) for field in _TASK_FIELDS} for task in self.tasks]
+        self._save_executor.submit(self.write_tasks_file, self.current_user, user_data_file, tasks_data)
+
+    def write_tasks_file(self, username, user_data_file, tasks_data):
+        """
+        Runs on the save thread. Writes to a temporary file and swaps it in with os.replace,
+        so the tasks file is never left half-written.
+        """
+        tmp_file = user_data_file + ".tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(json_dumps(tasks_data))
+            os.replace(tmp_file, user_data_file)
+        except Exception as e:
+            self.tasks_save_failed.emit(f"Failed to save tasks for {username}: {e}")
+
+    @pyqtSlot(str)
+    def show_save_error(self, message):
+        """Shows errors reported by the background save thread (runs on the GUI thread)."""
+        self.show_message_box("Save Error", message, QMessageBox.Critical)
 
 
     def setup_reminder_timer(self):
         self.reminder_timer = QTimer(self)
-        self.reminder_timer.setInterval(60 * 1000)
+        self.reminder_timer.setSingleShot(True)
+        self.reminder_timer.setTimerType(Qt.PreciseTimer) # Fire at the due minute, not a few seconds early
         self.reminder_timer.timeout.connect(self.check_reminders)
-        self.reminder_timer.start()
+        self.schedule_next_reminder()
+
+    def schedule_next_reminder(self):
+        """
+        (Re)arms the reminder timer for the earliest pending due time, or REMINDER_MAX_INTERVAL
+        from now if that is sooner. _active_tasks is sorted by due time, so this only looks at its head;
+        it is called again whenever that head changes. The cap bounds how late a reminder can be
+        if the clock jumps, e.g. across a suspend.
+        """
+        interval = self.REMINDER_MAX_INTERVAL
+        if self._active_tasks and self._active_tasks[0].due_date is not None:
+            interval = min(interval, max(1, self._active_tasks[0].due_date - time.time()))
+        self.reminder_timer.start(int(interval * 1000))
 
+    @pyqtSlot()
     def check_reminders(self):
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Checking for reminders...")
-        now = datetime.now()
-        for task in self.tasks:
-            if not task.completed and not task.reminded:
-                try:
-                    due_dt = datetime.strptime(task.due_date, "%Y-%m-%d %H:%M")
-                    
-                    if now >= due_dt:
-                        print(f"Task '{task.name}' is overdue. Triggering notifications.")
-                        self.trigger_all_notifications(task)
-                        task.reminded = True
-                        self.save_tasks()
-                    else:
-                        print(f"Task '{task.name}' is not yet due (Due: {task.due_date}).")
-                except ValueError:
-                    print(f"Warning: Could not parse due date for task '{task.name}': {task.due_date}")
-            elif task.completed:
-                print(f"Task '{task.name}' is completed, skipping reminder check.")
-            elif task.reminded:
-                print(f"Task '{task.name}' already reminded, skipping reminder check.")
+        logger.debug("Checking for reminders...")
+        now_ts = time.time()
+        # _active_tasks is sorted by due time, so everything due is at the front
+        due_count = 0
+        for task in self._active_tasks:
+            if not task.is_due(now_ts):
+                break
+            due_count += 1
+        if not due_count:
+            self.schedule_next_reminder()
+            return
+
+        due_tasks = self._active_tasks[:due_count]
+        del self._active_tasks[:due_count]
+        self.schedule_next_reminder() # Before the reminder dialogs, which stay open until dismissed
+        for task in due_tasks:
+            # Marked before notifying: the reminder dialog runs a nested event loop that can re-enter this check
+            task.reminded = True
+            logger.info("Task '%s' is overdue. Triggering notifications.", task.name)
+            self.trigger_all_notifications(task)
+        self.save_tasks()
 
     def trigger_completion_notification(self, task):
         title = "Task Completed!"
-        message = f"Congratulations! You have successfully completed the task:\n\nTask: {task.name}\nDue: {task.due_date}\nPriority: {task.priority}"
+        message = f"Congratulations! You have successfully completed the task:\n\nTask: {task.name}\nDue: {task.due_date_text()}\nPriority: {task.priority}"
         self.show_message_box(title, message, QMessageBox.Information)
 
     def trigger_all_notifications(self, task):
-        print(f"Attempting to trigger all notifications for task: {task.name}")
-        # 1. In-app Message Box Notification
+        logger.debug("Attempting to trigger all notifications for task: %s", task.name)
+        # Email, SMS and desktop notifications block on network/OS calls, so they run
+        # on the global thread pool and report failures back through notification_failed.
+        # Workers get a snapshot of the task, never the live object the GUI edits, and are only
+        # started for channels that are configured and have a recipient.
+        pool = QThreadPool.globalInstance()
+        snapshot = task.copy()
+        # 1. Actual Email Notification
+        if not self.EMAIL_ENABLED:
+            logger.debug("Email sender credentials not configured. Skipping email notification.")
+        elif not self._recipient_email:
+            logger.info("No email address found for user %s. Skipping email notification.", self.current_user)
+        else:
+            pool.start(NotificationWorker(self.send_email_notification, snapshot, self._recipient_email))
+
+        # 2. Actual Mobile (SMS) Notification
+        if not self.SMS_ENABLED:
+            logger.debug("Twilio credentials not configured. Skipping SMS notification.")
+        elif not self._recipient_phone:
+            logger.info("No mobile number found for user %s. Skipping SMS notification.", self.current_user)
+        else:
+            pool.start(NotificationWorker(self.send_sms_notification, snapshot, self._recipient_phone))
+
+        # 3. Native Desktop Notification (using plyer)
+        pool.start(NotificationWorker(self.send_desktop_notification, snapshot))
+
+        # 4. In-app Message Box Notification
         self.show_message_box(
             "Task Reminder: Time's Up!",
-            f"Task: {task.name}\nDue: {task.due_date}\nPriority: {task.priority}\n\n"
+            f"Task: {task.name}\nDue: {task.due_date_text()}\nPriority: {task.priority}\n\n"
             "This task's due time has passed!",
             QMessageBox.Warning
         )
 
-        # 2. Actual Email Notification
-        self.send_email_notification(task)
-
-        # 3. Actual Mobile (SMS) Notification
-        self.send_sms_notification(task)
-
-        # 4. Native Desktop Notification (using plyer)
-        if PLYER_AVAILABLE:
-            try:
-                notification.notify(
-                    title=f"Task Overdue: {task.name}",
-                    message=f"Due: {task.due_date}\nPriority: {task.priority}\n\n"
-                            f"Action: {task.next_step if task.next_step else 'No specific next step'}",
-                    app_name="Student Task Manager",
-                    # app_icon='path/to/your/app_icon.ico', # Optional: Uncomment and replace with path to an icon file
-                    timeout=10 # Notification will disappear after 10 seconds (or stay until dismissed)
-                )
-                print(f"Desktop notification sent for task: {task.name}")
-            except Exception as e:
-                print(f"Failed to send desktop notification: {e}")
-        else:
-            print("Plyer not available, skipping desktop notification.")
+    def send_desktop_notification(self, task):
+        """Shows a native desktop notification using plyer, if it is installed."""
+        notification = self.get_plyer_notification()
+        if not notification:
+            logger.debug("Plyer not available, skipping desktop notification.")
+            return
+        try:
+            notification.notify(
+                title=f"Task Overdue: {task.name}",
+                message=f"Due: {task.due_date_text()}\nPriority: {task.priority}\n\n"
+                        f"Action: {task.next_step if task.next_step else 'No specific next step'}",
+                app_name="Student Task Manager",
+                # app_icon='path/to/your/app_icon.ico', # Optional: Uncomment and replace with path to an icon file
+                timeout=10 # Notification will disappear after 10 seconds (or stay until dismissed)
+            )
+            logger.info("Desktop notification sent for task: %s", task.name)
+        except Exception as e:
+            logger.error("Failed to send desktop notification: %s", e)
 
-    def send_email_notification(self, task):
+    def send_email_notification(self, task, recipient_email):
         """
         Sends an email notification using SMTP.
-        Requires SENDER_EMAIL and SENDER_EMAIL_PASSWORD (App Password for Gmail) to be configured.
+        Only started when SENDER_EMAIL and SENDER_EMAIL_PASSWORD (App Password for Gmail) are configured.
         """
-        print(f"Attempting to send email for task: {task.name}")
-        if not self.SENDER_EMAIL or not self.SENDER_EMAIL_PASSWORD or \
-           self.SENDER_EMAIL == "your_email@gmail.com" or self.SENDER_EMAIL_PASSWORD == "your_app_password":
-            print("Email sender credentials not configured or are placeholders. Skipping email notification.")
-            return
+        logger.debug("Attempting to send email for task: %s", task.name)
 
         email_subject = f"OVERDUE: Task '{task.name}' is due!"
         email_body = (
             f"Dear Student,\n\n"
             f"This is a reminder that your task:\n"
             f"Name: {task.name}\n"
-            f"Due Date: {task.due_date}\n"
+            f"Due Date: {task.due_date_text()}\n"
             f"Priority: {task.priority}\n"
             f"Description: {task.description if task.description else 'N/A'}\n"
             f"Next Step: {task.next_step if task.next_step else 'N/A'}\n\n"
             f"The due time for this task has passed. Please take action.\n\n"
             f"Best regards,\nYour Task Manager"
         )
-        
-        users_data = MainTaskManagerApp.load_users_from_file() # Access users data
-        recipient_email = users_data.get(self.current_user, {}).get("email") # Get current user's email
-
-        if not recipient_email:
-            print(f"No email address found for user {self.current_user}. Skipping email notification.")
-            return
 
         message = MIMEText(email_body)
         message['Subject'] = email_subject
         message['From'] = self.SENDER_EMAIL
         message['To'] = recipient_email
 
-        try:
-            context = ssl.create_default_context()
-            with smtplib.SMTP_SSL("smtp.gmail.com", 465, context=context) as server:
-                server.login(self.SENDER_EMAIL, self.SENDER_EMAIL_PASSWORD)
-                server.send_message(message)
-            print(f"Email notification sent to {recipient_email}")
-        except Exception as e:
-            print(f"Failed to send email notification: {e}")
-            self.show_message_box("Email Error", f"Failed to send email: {e}", QMessageBox.Critical)
+        # Workers may send concurrently; the SMTP connection must only be used by one at a time.
+        with self._smtp_lock:
+            try:
+                self.get_smtp_connection().send_message(message)
+                logger.info("Email notification sent to %s", recipient_email)
+            except Exception as e:
+                self.close_smtp_connection() # Reconnect on the next reminder
+                logger.error("Failed to send email notification: %s", e)
+                self.notification_failed.emit("Email Error", f"Failed to send email: {e}")
 
 
-    def send_sms_notification(self, task):
+    def get_smtp_connection(self):
         """
-        Sends an SMS notification using Twilio.
-        Requires TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, and TWILIO_PHONE_NUMBER to be configured.
+        Returns the cached, logged-in SMTP connection if the server still answers NOOP,
+        otherwise opens and logs in a new one so a burst of reminders shares one TLS handshake.
         """
-        print(f"Attempting to send SMS for task: {task.name}")
-        if not TWILIO_AVAILABLE:
-            print("Twilio library not available. Skipping SMS notification.")
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.close_smtp_connection()
+
+        context = ssl.create_default_context()
+        server = smtplib.SMTP_SSL("smtp.gmail.com", 465, context=context)
+        try:
+            server.login(self.SENDER_EMAIL, self.SENDER_EMAIL_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+
+    def close_smtp_connection(self):
+        """Closes the cached SMTP connection, if any."""
+        if self._smtp is None:
             return
-        
-        if not self.TWILIO_ACCOUNT_SID or not self.TWILIO_AUTH_TOKEN or not self.TWILIO_PHONE_NUMBER or \
-           self.TWILIO_ACCOUNT_SID == "ACxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" or \
-           self.TWILIO_AUTH_TOKEN == "your_auth_token" or \
-           self.TWILIO_PHONE_NUMBER == "+1234567890":
-            print("Twilio credentials not configured or are placeholders. Skipping SMS notification.")
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def shutdown(self):
+        """
+        Writes any pending task changes and releases network connections held for notifications.
+        Called when the application closes.
+        """
+        if self._save_timer.isActive():
+            self.flush_tasks()
+        self._save_executor.shutdown(wait=True)
+        with self._smtp_lock:
+            self.close_smtp_connection()
+        self._twilio_client = None
+
+    @pyqtSlot(str, str)
+    def show_notification_error(self, title, message):
+        """Shows errors reported by background notification workers (runs on the GUI thread)."""
+        self.show_message_box(title, message, QMessageBox.Critical)
+
+    def send_sms_notification(self, task, recipient_mobile):
+        """
+        Sends an SMS notification using Twilio.
+        Only started when TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, and TWILIO_PHONE_NUMBER are configured.
+        """
+        logger.debug("Attempting to send SMS for task: %s", task.name)
+        Client = self.get_twilio_client_class()
+        if not Client:
+            logger.debug("Twilio library not available. Skipping SMS notification.")
             return
 
         sms_message = (
-            f"Task Alert: '{task.name}' due on {task.due_date}. "
+            f"Task Alert: '{task.name}' due on {task.due_date_text()}. "
             f"Priority: {task.priority}. Time's up! Check your manager."
         )
-        # Retrieve recipient mobile number from user data
-        users_data = MainTaskManagerApp.load_users_from_file()
-        recipient_mobile = users_data.get(self.current_user, {}).get("phone_number")
-
-        if not recipient_mobile:
-            print(f"No mobile number found for user {self.current_user}. Skipping SMS notification.")
-            return
-        
         try:
-            client = Client(self.TWILIO_ACCOUNT_SID, self.TWILIO_AUTH_TOKEN)
-            message = client.messages.create(
+            if self._twilio_client is None:
+                self._twilio_client = Client(self.TWILIO_ACCOUNT_SID, self.TWILIO_AUTH_TOKEN)
+            message = self._twilio_client.messages.create(
                 to=recipient_mobile,
                 from_=self.TWILIO_PHONE_NUMBER,
                 body=sms_message
             )
-            print(f"SMS notification sent to {recipient_mobile}. SID: {message.sid}")
+            logger.info("SMS notification sent to %s. SID: %s", recipient_mobile, message.sid)
         except Exception as e:
-            print(f"Failed to send SMS notification: {e}")
-            self.show_message_box("SMS Error", f"Failed to send SMS: {e}", QMessageBox.Critical)
+            logger.error("Failed to send SMS notification: %s", e)
+            self.notification_failed.emit("SMS Error", f"Failed to send SMS: {e}")
 
 
 # --- Main Application Manager (QStackedWidget) ---
@@ -1360,15 +1718,19 @@ class MainTaskManagerApp(QStackedWidget):
     Manages the different application pages: Login, Signup, and the main Task Manager UI.
     """
     USERS_FILE = "users.json" # Class-level constant for user data file
+    user_store = UserStore(USERS_FILE) # Shared by the login and sign up pages and load_users_from_file
 
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Student Task Manager")
         self.setGeometry(100, 100, 1000, 700) # Initial window size for the stacked widget
 
-        self.login_page = LoginWindow(self)
-        self.signup_page = SignUpWindow(self)
+        # Set before the pages are built so each widget is polished once against the shared rules
+        QApplication.instance().setStyleSheet(APP_QSS)
+
         self.main_task_manager_ui = MainTaskManagerUI() # The actual task manager UI
+        self.login_page = LoginWindow(self, self.user_store, self.main_task_manager_ui)
+        self.signup_page = SignUpWindow(self, self.user_store)
 
         self.addWidget(self.login_page)    # Index 0
         self.addWidget(self.signup_page)   # Index 1
@@ -1376,21 +1738,32 @@ class MainTaskManagerApp(QStackedWidget):
 
         self.setCurrentIndex(0) # Start with the login page
 
+    @pyqtSlot()
+    def tear_down_auth_pages(self):
+        """Removes and deletes the login and sign up pages after a successful login."""
+        for page in (self.login_page, self.signup_page):
+            self.removeWidget(page)
+            page.deleteLater()
+        self.login_page = None
+        self.signup_page = None
+
+    def closeEvent(self, event):
+        self.main_task_manager_ui.shutdown()
+        super().closeEvent(event)
+
     @classmethod
     def load_users_from_file(cls):
-        """Class method to load users data, accessible from anywhere."""
-        try:
-            with open(cls.USERS_FILE, "r") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {}
-        except json.JSONDecodeError:
-            print("Error reading user data file. Returning empty users dict.")
-            return {}
+        """
+        Class method to load users data, accessible from anywhere on the GUI thread.
+        Served from the shared user_store, so the file is only parsed again after it changes.
+        The returned dict is shared; treat it as read-only.
+        """
+        return cls.user_store.get()
 
 
 # --- Main Application Entry Point ---
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s: %(message)s")
     app = QApplication(sys.argv)
     manager = MainTaskManagerApp() # Instantiate the stacked widget
     manager.show()